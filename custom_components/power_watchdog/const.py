@@ -16,7 +16,7 @@ CONF_VOLTAGE_ENTITY_ID = "voltage_entity_id"
 CONF_DEBOUNCE_SECONDS = "debounce_seconds"
 DEFAULT_DEBOUNCE_SECONDS = 10
 
-OFFLINE_STATES = {"unavailable", "unknown", "offline"}
+OFFLINE_STATES = frozenset(("unavailable", "unknown", "offline"))
 
 CONF_STALE_TIMEOUT_SECONDS = "stale_timeout_seconds"
 DEFAULT_STALE_TIMEOUT_SECONDS = 90
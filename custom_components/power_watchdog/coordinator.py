@@ -1,18 +1,22 @@
 from __future__ import annotations
 
-import time
 import asyncio
 import logging
-from dataclasses import dataclass
-from datetime import timedelta
+import math
+from datetime import datetime
+from operator import attrgetter
+from typing import NamedTuple
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.event import async_track_state_change_event, async_track_time_interval
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.event import async_call_later, async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    DOMAIN,
     CONF_DEBOUNCE_SECONDS,
     CONF_ENTITY_ID,                # fallback (старый ключ)
     CONF_VOLTAGE_ENTITY_ID,        # новый ключ
@@ -34,47 +38,188 @@ from .const import (
 from .telegram import async_send_telegram
 from .svitlobot import async_channel_ping
 
+__all__ = ["PowerWatchdogCoordinator", "WatchdogData"]
+
 _LOGGER = logging.getLogger(__name__)
 
 SVITLOBOT_PING_INTERVAL_S = 65
 
+# Adaptive periodic check: fast right after a transition, backing off while quiet
+CHECK_DELAY_MIN_S = 5
+CHECK_DELAY_MAX_S = 60
+# While online, transitions arrive via the state listener; ticks only serve the caps in
+# _next_check_delay. Only reachable with refresh_seconds=0: a refresh caps every delay.
+CHECK_DELAY_ONLINE_MAX_S = 300
+
+# Static parts of Telegram messages, shared by all entries
+TITLE_ONLINE = "✅ Світло є"
+TITLE_OFFLINE = "❌ Світло зникло"
+RESTART_PREFIX = "🟦 Бот було перезапущено\n\n"
+STATUS_ONLINE = "✅ Зараз: світло є\n"
+STATUS_OFFLINE = "❌ Зараз: світла немає\n"
+ONLINE_FOR_PREFIX = "Світло було: "
+OFFLINE_FOR_PREFIX = "Світла не було: "
+
+# Checks due within this window of each other run in the same tick
+CHECK_BATCH_SLACK_S = 1.0
+# Shortest reschedule when a throttle is about to come due (never a zero-delay loop)
+CHECK_DELAY_FLOOR_S = CHECK_BATCH_SLACK_S
+
+CHECK_SCHEDULER_KEY = "_check_scheduler"
+
+# Debounce re-arms on every transition but never holds a commit longer than this
+DEBOUNCE_MAX_WAIT_MIN_S = 15
+
+# Hold the startup message this many debounce periods so a first transition can carry it
+STARTUP_MERGE_DEBOUNCE_FACTOR = 2
 
-@dataclass(frozen=True)
-class WatchdogData:
+# Re-evaluate shortly after a non-blocking update_entity instead of waiting on it
+PROBE_RECHECK_DELAY_S = 2
+
+
+class WatchdogData(NamedTuple):
     online: bool
     watched_entity_id: str
     state: str | None
 
 
-def _is_online(state_str: str | None) -> bool:
-    if state_str is None:
-        return False
-    return state_str not in OFFLINE_STATES
+def _is_online(state_str: str | None, _offline: frozenset[str] = OFFLINE_STATES) -> bool:
+    return state_str is not None and state_str not in _offline
+
+
+def _voltage_line(state_str: str | None) -> str:
+    return f"Напруга: {state_str} В\n" if state_str is not None else ""
 
 
 def _format_duration(seconds: float | None) -> str | None:
     if seconds is None:
         return None
-    if seconds < 0:
-        seconds = 0
 
-    total = int(seconds)
+    total = max(0, int(seconds))
+
+    # Common case: under an hour
+    if total < 3600:
+        minutes, secs = divmod(total, 60)
+        return f"{minutes}хв {secs}с" if minutes else f"{secs}с"
+
     days, rem = divmod(total, 86400)
     hours, rem = divmod(rem, 3600)
     minutes, secs = divmod(rem, 60)
 
-    parts = []
     if days:
-        parts.append(f"{days}д")
-    if hours:
-        parts.append(f"{hours}г")
-    if minutes:
-        parts.append(f"{minutes}хв")
-    parts.append(f"{secs}с")
-    return " ".join(parts)
+        return f"{days}д {hours}г {minutes}хв {secs}с"
+    return f"{hours}г {minutes}хв {secs}с"
+
+
+class _CheckScheduler:
+    """One timer for all watchdog entries; runs every coordinator that is due in one tick."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.hass = hass
+        self._due: dict[PowerWatchdogCoordinator, float] = {}
+        self._unsub = None
+        self._next_at: float | None = None
+
+    @classmethod
+    def async_get(cls, hass: HomeAssistant) -> _CheckScheduler:
+        domain_data = hass.data.setdefault(DOMAIN, {})
+        scheduler = domain_data.get(CHECK_SCHEDULER_KEY)
+        if scheduler is None:
+            scheduler = domain_data[CHECK_SCHEDULER_KEY] = cls(hass)
+        return scheduler
+
+    @callback
+    def async_schedule(self, coordinator: PowerWatchdogCoordinator, delay: float, sooner_only: bool = False) -> None:
+        at = self.hass.loop.time() + delay
+        if sooner_only:
+            # Only pull an already scheduled (not currently running) check forward
+            current = self._due.get(coordinator)
+            if current is None or current <= at:
+                return
+        self._due[coordinator] = at
+        self._arm()
+
+    @callback
+    def async_remove(self, coordinator: PowerWatchdogCoordinator) -> None:
+        self._due.pop(coordinator, None)
+        if self._due:
+            return
+        if self._unsub:
+            self._unsub()
+            self._unsub = None
+            self._next_at = None
+        domain_data = self.hass.data.get(DOMAIN)
+        if domain_data and domain_data.get(CHECK_SCHEDULER_KEY) is self:
+            domain_data.pop(CHECK_SCHEDULER_KEY)
+
+    @callback
+    def _arm(self) -> None:
+        if not self._due:
+            return
+        next_at = min(self._due.values())
+        if self._unsub and self._next_at is not None and self._next_at <= next_at:
+            return
+        if self._unsub:
+            self._unsub()
+        self._next_at = next_at
+        self._unsub = async_call_later(self.hass, max(0.0, next_at - self.hass.loop.time()), self._tick)
+
+    @callback
+    def _tick(self, now) -> None:
+        self._unsub = None
+        self._next_at = None
+
+        limit = self.hass.loop.time() + CHECK_BATCH_SLACK_S
+        due = [c for c, at in self._due.items() if at <= limit]
+        for c in due:
+            del self._due[c]
+
+        # Checks never suspend (probes are fire-and-forget), so run them inline
+        for c in due:
+            try:
+                c._periodic_check(now)
+            except Exception:  # noqa: BLE001
+                _LOGGER.exception("Periodic check failed")
+
+        self._arm()
 
 
 class PowerWatchdogCoordinator(DataUpdateCoordinator[WatchdogData]):
+    # Base class keeps its __dict__; slots cover our own hot attributes
+    __slots__ = (
+        "entry",
+        "_session",
+        "_unsub",
+        "_scheduler",
+        "_pending_timer",
+        "_pending_intent",
+        "_debounce_first_at",
+        "_probe_recheck",
+        "_update_task",
+        "_pending_startup_text",
+        "_startup_cancel",
+        "_stale_timeout",
+        "_check_delay",
+        "_running",
+        "_voltage_entity_id",
+        "_token",
+        "_chat_id",
+        "_debounce",
+        "_notify_on_start",
+        "_refresh_every",
+        "_telegram_enabled",
+        "_svitlobot_channel_key",
+        "_probe_when_offline",
+        "_probe_every",
+        "_last_probe_ts",
+        "_online_since",
+        "_offline_since",
+        "_last_refresh_ts",
+        "_last_svitlobot_ping_ts",
+        "_device_line",
+        "_report_time_getter",
+    )
+
     def __init__(self, hass: HomeAssistant, entry: ConfigEntry) -> None:
         super().__init__(
             hass=hass,
@@ -83,15 +228,24 @@ class PowerWatchdogCoordinator(DataUpdateCoordinator[WatchdogData]):
             update_interval=None,
         )
         self.entry = entry
+        self._session = async_get_clientsession(hass)
         self._unsub = None
-        self._unsub_timer = None
-        self._pending_task: asyncio.Task | None = None
+        self._scheduler: _CheckScheduler | None = None
+        self._pending_timer: asyncio.TimerHandle | None = None
+        # Latest (new_online, reason, old_state, new_state) seen within the debounce window
+        self._pending_intent: tuple[bool, str, str | None, str | None] | None = None
+        self._debounce_first_at: float | None = None
+        self._probe_recheck: asyncio.TimerHandle | None = None
+        self._update_task: asyncio.Task | None = None
+        self._pending_startup_text: str | None = None
+        self._startup_cancel: CALLBACK_TYPE | None = None
 
         def _cfg(key, default=None):
             return entry.options.get(key, entry.data.get(key, default))
 
         self._stale_timeout = int(_cfg(CONF_STALE_TIMEOUT_SECONDS, DEFAULT_STALE_TIMEOUT_SECONDS))
-        self._check_interval = 15  # periodic check tick
+        self._check_delay = CHECK_DELAY_MIN_S  # next periodic check delay (backs off)
+        self._running = False
 
         self._voltage_entity_id = (
             _cfg(CONF_VOLTAGE_ENTITY_ID)
@@ -110,33 +264,54 @@ class PowerWatchdogCoordinator(DataUpdateCoordinator[WatchdogData]):
 
         self._probe_when_offline = True
         self._probe_every = 20
-        self._last_probe_ts = 0.0
+        self._last_probe_ts = -math.inf  # first probe fires whatever the monotonic origin
 
         self._online_since = None
         self._offline_since = None
-        self._last_refresh_ts = 0.0
+        self._last_refresh_ts = -math.inf
 
         # NEW: svitlobot ping throttling
-        self._last_svitlobot_ping_ts = 0.0
+        self._last_svitlobot_ping_ts = -math.inf
+
+        # Per-entry static part of Telegram messages
+        self._device_line = f"Пристрій: {self._voltage_entity_id}\n"
+
+        # Bound on first state seen: last_reported (newer HA) or last_updated
+        self._report_time_getter = None
 
     def _get_report_time(self, st) -> object:
-        rep = getattr(st, "last_reported", None)
-        return rep or st.last_updated
+        getter = self._report_time_getter
+        if getter is None:
+            attr = "last_reported" if getattr(st, "last_reported", None) is not None else "last_updated"
+            getter = self._report_time_getter = attrgetter(attr)
+        return getter(st)
+
+    def _report_age(self, st, now: datetime | None = None) -> float:
+        return ((now or dt_util.utcnow()) - self._get_report_time(st)).total_seconds()
 
-    def _compute_online(self) -> tuple[bool, str | None, float | None]:
+    def _compute_online(self, now: datetime | None = None) -> tuple[bool, str | None, float | None]:
+        """Return (online, state, age); age is only computed when staleness matters."""
         st = self.hass.states.get(self._voltage_entity_id)
         if st is None:
             return (False, None, None)
 
-        online = _is_online(st.state)
+        state = st.state
+        if not _is_online(state):
+            return (False, state, None)
+
+        if self._stale_timeout <= 0:
+            return (True, state, None)
 
-        age = (dt_util.utcnow() - self._get_report_time(st)).total_seconds()
-        if online and self._stale_timeout > 0 and age > self._stale_timeout:
-            return (False, st.state, age)
+        age = self._report_age(st, now)
+        if age > self._stale_timeout:
+            return (False, state, age)
 
-        return (online, st.state, age)
+        return (True, state, age)
 
     def _sync_data_without_notify(self, online: bool, state: str | None) -> None:
+        d = self.data
+        if d is not None and d.online == online and d.state == state:
+            return
         self.async_set_updated_data(
             WatchdogData(
                 online=online,
@@ -150,16 +325,16 @@ class PowerWatchdogCoordinator(DataUpdateCoordinator[WatchdogData]):
         if not self._svitlobot_channel_key:
             return
 
-        now_ts = time.time()
-        if self._last_svitlobot_ping_ts and (now_ts - self._last_svitlobot_ping_ts) < SVITLOBOT_PING_INTERVAL_S:
+        now_ts = self.hass.loop.time()
+        if now_ts - self._last_svitlobot_ping_ts < SVITLOBOT_PING_INTERVAL_S:
             return
 
         self._last_svitlobot_ping_ts = now_ts
         self.hass.async_create_task(async_channel_ping(self.hass, self._svitlobot_channel_key))
 
     async def async_start(self) -> None:
-        online, state, age = self._compute_online()
         now = dt_util.utcnow()
+        online, state, age = self._compute_online(now)
 
         if online:
             self._online_since = now
@@ -176,225 +351,374 @@ class PowerWatchdogCoordinator(DataUpdateCoordinator[WatchdogData]):
 
         # Telegram startup notify (if enabled)
         if self._notify_on_start and self._telegram_enabled and self._token and self._chat_id:
-            title = "🟦 Бот було перезапущено"
-            status = "✅ Зараз: світло є" if online else "❌ Зараз: світла немає"
+            status = STATUS_ONLINE if online else STATUS_OFFLINE
             extra = ""
+            if online and age is None:
+                # Staleness disabled -> age wasn't computed, startup is the only place that shows it
+                st = self.hass.states.get(self._voltage_entity_id)
+                if st is not None:
+                    age = self._report_age(st, now)
             if age is not None:
                 extra = f"Дані оновлювались: {int(age)}с тому\n"
 
-            voltage_line = ""
-            if state is not None and state not in OFFLINE_STATES:
-                voltage_line = f"Напруга: {state} В\n"
-            elif state in OFFLINE_STATES:
-                voltage_line = f"Напруга: {state} В\n"
+            voltage_line = _voltage_line(state)
 
             if online:
-                text = (
-                    f"{title}\n\n"
-                    f"{status}\n"
-                    f"{extra}"
-                    f"Пристрій: {self._voltage_entity_id}\n"
-                    f"{voltage_line}"
-                )
+                text = "".join((RESTART_PREFIX, status, extra, self._device_line, voltage_line))
             else:
-                text = (
-                    f"{title}\n\n"
-                    f"{status}\n"
-                    f"Пристрій: {self._voltage_entity_id}\n"
-                )
-
-            self.hass.async_create_task(
-                async_send_telegram(self.hass, self._token, self._chat_id, text)
+                text = "".join((RESTART_PREFIX, status, self._device_line))
+
+            # Sent alone when the window ends, or prepended to a transition message within it
+            self._pending_startup_text = text
+            self._startup_cancel = async_call_later(
+                self.hass,
+                self._debounce * STARTUP_MERGE_DEBOUNCE_FACTOR,
+                self._send_pending_startup_cb,
             )
 
+        # Hot-path locals for the state listener
+        offline_states = OFFLINE_STATES
+        sync_data = self._sync_data_without_notify
+        schedule_commit = self._schedule_commit_and_notify
+
         @callback
         def _handle(event):
-            old_state = event.data.get("old_state")
-            new_state = event.data.get("new_state")
+            event_data = event.data
+            old_state = event_data.get("old_state")
+            new_state = event_data.get("new_state")
+            if new_state is old_state:
+                return
 
+            old_state_str = old_state.state if old_state else None
             new_state_str = new_state.state if new_state else None
-            new_online = _is_online(new_state_str)
+            data = self.data
 
-            if self.data is not None and self.data.online == new_online:
-                self._sync_data_without_notify(new_online, new_state_str)
+            # Inlined _is_online: no call frame per event
+            new_online = new_state_str is not None and new_state_str not in offline_states
+
+            # Attribute-only update: nothing to do unless we're offline only because the report went stale
+            if old_state_str == new_state_str and (data is None or data.online or not new_online):
                 return
 
-            if self._pending_task and not self._pending_task.done():
-                self._pending_task.cancel()
+            if data is not None and data.online == new_online:
+                if data.state != new_state_str:
+                    sync_data(new_online, new_state_str)
+                return
 
-            self._pending_task = self.hass.async_create_task(
-                self._debounced_commit_and_notify(
-                    new_online=new_online,
-                    reason="state_change",
-                    old_state=(old_state.state if old_state else None),
-                    new_state=new_state_str,
-                )
+            self._reset_check_delay()
+            schedule_commit(
+                new_online=new_online,
+                reason="state_change",
+                old_state=old_state_str,
+                new_state=new_state_str,
             )
 
         self._unsub = async_track_state_change_event(
             self.hass,
-            [self._voltage_entity_id],
+            (self._voltage_entity_id,),
             _handle
         )
 
-        self._unsub_timer = async_track_time_interval(
-            self.hass,
-            self._periodic_check,
-            timedelta(seconds=self._check_interval)
-        )
+        self._running = True
+        self._scheduler = _CheckScheduler.async_get(self.hass)
+        self._scheduler.async_schedule(self, self._check_delay)
+
+    @callback
+    def _reset_check_delay(self) -> None:
+        """Poll fast again after a transition; re-arm the timer if it sleeps longer."""
+        if self._check_delay <= CHECK_DELAY_MIN_S:
+            return
+        self._check_delay = CHECK_DELAY_MIN_S
+        if self._running and self._scheduler:
+            self._scheduler.async_schedule(self, CHECK_DELAY_MIN_S, sooner_only=True)
+
+    def _next_check_delay(self, age: float | None) -> float:
+        online = bool(self.data and self.data.online)
+
+        delay = self._check_delay
+        self._check_delay = min(delay * 2, CHECK_DELAY_ONLINE_MAX_S if online else CHECK_DELAY_MAX_S)
+
+        # Keep probe / refresh / svitlobot cadence: cap by the time left, since a batched
+        # check may run up to CHECK_BATCH_SLACK_S early and skip a throttle that is almost due
+        now_ts = self.hass.loop.time()
+        if not online and self._probe_when_offline:
+            delay = min(delay, max(CHECK_DELAY_FLOOR_S, self._probe_every - (now_ts - self._last_probe_ts)))
+        if self._refresh_every > 0:
+            delay = min(delay, max(CHECK_DELAY_FLOOR_S, self._refresh_every - (now_ts - self._last_refresh_ts)))
+        if online and self._svitlobot_channel_key:
+            since_ping = now_ts - self._last_svitlobot_ping_ts
+            delay = min(delay, max(CHECK_DELAY_FLOOR_S, SVITLOBOT_PING_INTERVAL_S - since_ping))
+
+        # Approaching stale timeout -> check right around the boundary
+        if online and self._stale_timeout > 0 and age is not None:
+            delay = min(delay, max(CHECK_DELAY_MIN_S, self._stale_timeout - age + 1))
+
+        return delay
+
+    @callback
+    def _periodic_check(self, now: datetime) -> None:
+        age = None
+        try:
+            age = self._async_check(now)
+        finally:
+            if self._running and self._scheduler:
+                self._scheduler.async_schedule(self, self._next_check_delay(age))
 
-    async def _periodic_check(self, _now) -> None:
+    @callback
+    def _async_check(self, now: datetime) -> float | None:
         # ✅ Every 30 seconds while online -> ping svitlobot
         if self.data and self.data.online:
             self._fire_svitlobot_ping_if_needed()
 
-        # Probe when offline
-        if self.data and self._probe_when_offline and (not self.data.online):
-            now_ts = time.time()
-            if now_ts - self._last_probe_ts >= self._probe_every:
-                self._last_probe_ts = now_ts
-                try:
-                    await self.hass.services.async_call(
-                        "homeassistant",
-                        "update_entity",
-                        {"entity_id": self._voltage_entity_id},
-                        blocking=True,
-                    )
-                except Exception:  # noqa: BLE001
-                    _LOGGER.exception("update_entity probe failed")
-
-        now_ts = time.time()
-
-        # Optional refresh
-        if self._refresh_every > 0 and (now_ts - self._last_refresh_ts >= self._refresh_every):
+        now_ts = self.hass.loop.time()
+
+        # Probe when offline / optional refresh -> at most one update_entity per tick
+        need_probe = bool(
+            self.data
+            and self._probe_when_offline
+            and (not self.data.online)
+            and now_ts - self._last_probe_ts >= self._probe_every
+        )
+        need_refresh = self._refresh_every > 0 and (now_ts - self._last_refresh_ts >= self._refresh_every)
+
+        if need_probe or need_refresh:
+            self._last_probe_ts = now_ts
             self._last_refresh_ts = now_ts
-            try:
-                await self.hass.services.async_call(
-                    "homeassistant",
-                    "update_entity",
-                    {"entity_id": self._voltage_entity_id},
-                    blocking=True,
+            # Non-blocking: don't stall the tick on a slow integration, recheck a bit later
+            if self._update_task is None or self._update_task.done():
+                self._update_task = self.hass.async_create_background_task(
+                    self._async_update_voltage_entity(),
+                    name="power_watchdog update_entity",
+                )
+            if self._probe_recheck is None:
+                self._probe_recheck = self.hass.loop.call_later(
+                    PROBE_RECHECK_DELAY_S, self._recheck_after_probe
                 )
-            except Exception:
-                _LOGGER.exception("update_entity refresh failed")
 
-        online, state, age = self._compute_online()
+        return self._evaluate_online(now)
+
+    async def _async_update_voltage_entity(self) -> None:
+        # Same as homeassistant.update_entity, minus service registry / ServiceCall dispatch
+        try:
+            await async_update_entity(self.hass, self._voltage_entity_id)
+        except Exception:  # noqa: BLE001
+            _LOGGER.exception("update_entity probe/refresh failed")
+
+    @callback
+    def _recheck_after_probe(self) -> None:
+        # A refreshed report with an unchanged value fires no state_changed event
+        self._probe_recheck = None
+        if self._running:
+            self._evaluate_online()
+
+    @callback
+    def _evaluate_online(self, now: datetime | None = None) -> float | None:
+        online, state, age = self._compute_online(now)
         current = self.data.online if self.data else None
         if current is None:
-            return
+            return age
 
         if online == current:
             if self.data.state != state:
                 self._sync_data_without_notify(online, state)
-            return
+            return age
 
-        if self._pending_task and not self._pending_task.done():
-            self._pending_task.cancel()
+        self._reset_check_delay()
 
         reason = "probe_recovered" if online else (
             "stale_timeout" if (age is not None and self._stale_timeout > 0 and age > self._stale_timeout)
             else "periodic"
         )
 
-        self._pending_task = self.hass.async_create_task(
-            self._debounced_commit_and_notify(
-                new_online=online,
-                reason=reason,
-                old_state=self.data.state,
-                new_state=state,
-            )
+        self._schedule_commit_and_notify(
+            new_online=online,
+            reason=reason,
+            old_state=self.data.state,
+            new_state=state,
+            now=now,
         )
+        return age
 
-    async def _debounced_commit_and_notify(
+    @callback
+    def _schedule_commit_and_notify(
         self,
         new_online: bool,
         reason: str,
         old_state: str | None,
-        new_state: str | None
+        new_state: str | None,
+        now: datetime | None = None,
     ) -> None:
-        try:
-            if self._debounce > 0:
-                await asyncio.sleep(self._debounce)
+        # No debounce -> commit inline, the caller has just read the state
+        if self._debounce <= 0:
+            self._commit_and_notify_now(new_online, reason, old_state, new_state, recheck=False, now=now)
+            return
 
-            current_online, current_state, age = self._compute_online()
-            if current_online != new_online:
-                return
+        # Latest intent wins; wait for a quiet window, bounded by max_wait from the first flip
+        self._pending_intent = (new_online, reason, old_state, new_state)
+        now_ts = self.hass.loop.time()
+        if self._debounce_first_at is None:
+            self._debounce_first_at = now_ts
+        max_wait = max(self._debounce * 3, DEBOUNCE_MAX_WAIT_MIN_S)
+        delay = max(0.0, min(self._debounce, max_wait - (now_ts - self._debounce_first_at)))
+
+        # Bare TimerHandle: cancel is a flag flip, no HassJob / datetime per re-arm
+        self._cancel_pending()
+        self._pending_timer = self.hass.loop.call_later(delay, self._commit_and_notify_cb)
+
+    @callback
+    def _cancel_pending(self) -> None:
+        """Cancel the pending commit at most once; the reference is dropped with it."""
+        timer, self._pending_timer = self._pending_timer, None
+        if timer is not None:
+            timer.cancel()
+
+    @callback
+    def _commit_and_notify_cb(self) -> None:
+        self._pending_timer = None
+        self._debounce_first_at = None
+        intent, self._pending_intent = self._pending_intent, None
+        if intent is None:
+            return
+        # Recheck drops the intent if the sensor flapped back to the committed state
+        self._commit_and_notify_now(*intent, recheck=True)
 
-            prev_online = self.data.online if self.data else None
-            now = dt_util.utcnow()
+    @callback
+    def _commit_and_notify_now(
+        self,
+        new_online: bool,
+        reason: str,
+        old_state: str | None,
+        new_state: str | None,
+        recheck: bool,
+        now: datetime | None = None,
+    ) -> None:
+        current_online, current_state, age = new_online, new_state, None
+        if recheck:
+            # Shortcut: state unchanged since scheduling and the verdict didn't come from staleness
+            st = self.hass.states.get(self._voltage_entity_id)
+            unchanged = (
+                st is not None
+                and st.state == new_state
+                and _is_online(new_state) == new_online
+                and not (new_online and 0 < self._stale_timeout <= self._debounce)
+            )
+            if not unchanged:
+                current_online, current_state, age = self._compute_online(now)
+        if current_online != new_online:
+            return
 
-            if prev_online is not None and prev_online == new_online:
-                self._sync_data_without_notify(new_online, current_state)
-                return
+        prev_online = self.data.online if self.data else None
+        if now is None:
+            now = dt_util.utcnow()
 
-            duration_line = None
-            extra = ""
+        if prev_online is not None and prev_online == new_online:
+            self._sync_data_without_notify(new_online, current_state)
+            return
 
-            became_online = False
-
-            if prev_online is not None and prev_online != new_online:
-                if prev_online and (not new_online):
-                    online_for = (now - self._online_since).total_seconds() if self._online_since else None
-                    duration_line = _format_duration(online_for)
-                    self._offline_since = now
-                    self._online_since = None
-                    if duration_line:
-                        extra = f"Світло було: {duration_line}\n"
-                elif (not prev_online) and new_online:
-                    offline_for = (now - self._offline_since).total_seconds() if self._offline_since else None
-                    duration_line = _format_duration(offline_for)
-                    self._online_since = now
-                    self._offline_since = None
-                    if duration_line:
-                        extra = f"Світла не було: {duration_line}\n"
-                    became_online = True
+        duration_line = None
+        extra = ""
+
+        became_online = False
+
+        if prev_online is not None and prev_online != new_online:
+            if prev_online and (not new_online):
+                online_for = (now - self._online_since).total_seconds() if self._online_since else None
+                duration_line = _format_duration(online_for)
+                self._offline_since = now
+                self._online_since = None
+                if duration_line:
+                    extra = "".join((ONLINE_FOR_PREFIX, duration_line, "\n"))
+            elif (not prev_online) and new_online:
+                offline_for = (now - self._offline_since).total_seconds() if self._offline_since else None
+                duration_line = _format_duration(offline_for)
+                self._online_since = now
+                self._offline_since = None
+                if duration_line:
+                    extra = "".join((OFFLINE_FOR_PREFIX, duration_line, "\n"))
+                became_online = True
+        else:
+            if new_online:
+                self._online_since = now
+                self._offline_since = None
+                became_online = True
             else:
-                if new_online:
-                    self._online_since = now
-                    self._offline_since = None
-                    became_online = True
-                else:
-                    self._offline_since = now
-                    self._online_since = None
+                self._offline_since = now
+                self._online_since = None
 
-            self._sync_data_without_notify(new_online, current_state)
+        self._sync_data_without_notify(new_online, current_state)
 
-            # When we become online -> ping immediately (then periodic will keep every 30s)
-            if new_online and became_online:
-                self._fire_svitlobot_ping_if_needed()
+        # When we become online -> ping immediately (then periodic will keep every 30s)
+        if new_online and became_online:
+            self._fire_svitlobot_ping_if_needed()
 
-            # If Telegram disabled -> stop here (no notify)
-            if (not self._telegram_enabled) or (not self._token) or (not self._chat_id):
-                return
+        # If Telegram disabled -> stop here (no notify)
+        if (not self._telegram_enabled) or (not self._token) or (not self._chat_id):
+            return
 
-            title = "✅ Світло є" if new_online else "❌ Світло зникло"
+        if reason == "stale_timeout" and age is not None:
+            _ = age  # keep for future logging if needed
 
-            if reason == "stale_timeout" and age is not None:
-                _ = age  # keep for future logging if needed
+        # Only show a real reading, not "unavailable"/"unknown"
+        voltage_line = _voltage_line(current_state if _is_online(current_state) else None)
 
-            voltage_line = ""
-            if current_state is not None and current_state not in OFFLINE_STATES:
-                voltage_line = f"Напруга: {current_state} В\n"
+        text = "".join((
+            TITLE_ONLINE if new_online else TITLE_OFFLINE,
+            "\n\n",
+            extra,
+            voltage_line,
+        ))
 
-            text = (
-                f"{title}\n\n"
-                f"{extra}"
-                f"{voltage_line}"
-            )
+        startup_text = self._take_pending_startup_text()
+        if startup_text:
+            text = "".join((startup_text, "\n", text))
 
-            await async_send_telegram(self.hass, self._token, self._chat_id, text)
+        self._send_telegram(text)
 
-        except asyncio.CancelledError:
-            return
+    @callback
+    def _send_telegram(self, text: str) -> None:
+        self.hass.async_create_background_task(
+            async_send_telegram(self.hass, self._token, self._chat_id, text, session=self._session),
+            name="power_watchdog telegram",
+        )
+
+    @callback
+    def _take_pending_startup_text(self) -> str | None:
+        if self._startup_cancel:
+            self._startup_cancel()
+            self._startup_cancel = None
+        text, self._pending_startup_text = self._pending_startup_text, None
+        return text
+
+    @callback
+    def _send_pending_startup_cb(self, _now) -> None:
+        self._startup_cancel = None
+        text = self._take_pending_startup_text()
+        if text:
+            self._send_telegram(text)
 
     async def async_stop(self) -> None:
-        if self._pending_task and not self._pending_task.done():
-            self._pending_task.cancel()
+        self._running = False
+
+        self._cancel_pending()
+        self._pending_intent = None
+        self._debounce_first_at = None
+        self._take_pending_startup_text()
+
+        if self._probe_recheck:
+            self._probe_recheck.cancel()
+            self._probe_recheck = None
 
         if self._unsub:
             self._unsub()
             self._unsub = None
 
-        if self._unsub_timer:
-            self._unsub_timer()
-            self._unsub_timer = None
+        if self._scheduler:
+            self._scheduler.async_remove(self)
+            self._scheduler = None
+
+        # Cancel at the caller and wait for it, so no probe outlives the entry.
+        # asyncio.wait doesn't re-raise the task's CancelledError, but a cancel of stop itself still propagates
+        task, self._update_task = self._update_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.wait((task,))
@@ -3,6 +3,7 @@ from __future__ import annotations
 import logging
 from typing import Any
 
+from aiohttp import ClientSession
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
@@ -13,8 +14,10 @@ async def async_send_telegram(
     token: str,
     chat_id: str,
     text: str,
+    session: ClientSession | None = None,
 ) -> None:
-    session = async_get_clientsession(hass)
+    if session is None:
+        session = async_get_clientsession(hass)
     url = f"https://api.telegram.org/bot{token}/sendMessage"
     payload: dict[str, Any] = {
         "chat_id": chat_id,